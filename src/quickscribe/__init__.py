@@ -8,7 +8,15 @@ with complete privacy - nothing sent to external servers.
 __version__ = "0.1.0"
 __author__ = "QuickScribe"
 
-from .core import QuickScribeCore
 from .main import main
 
-__all__ = ["QuickScribeCore", "main"]
\ No newline at end of file
+__all__ = ["QuickScribeCore", "main"]
+
+
+def __getattr__(name):
+    # Importing the core pulls in audio and ML libraries, so only do it on
+    # first use; the entry point imports this package just to reach main()
+    if name == "QuickScribeCore":
+        from .core import QuickScribeCore
+        return QuickScribeCore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,8 +3,23 @@ Core business logic for QuickScribe.
 
 This module contains the main API and business logic components
 without any UI dependencies.
+
+The Whisper model tier is chosen with the QUICKSCRIBE_MODEL environment
+variable (or the model_size argument to QuickScribeCore). The default,
+"tiny", transcribes roughly 3-5x faster than "base" at a small accuracy
+cost; set QUICKSCRIBE_MODEL=base (or small/medium/large/turbo) when
+accuracy matters more than speed.
+
+Transcription is pinned to English by default, which skips Whisper's
+language detection pass; set QUICKSCRIBE_LANGUAGE to another language
+code, or to "auto" to detect it per recording.
+
+Transcription runs on faster-whisper (CTranslate2, int8) by default;
+QUICKSCRIBE_BACKEND=whisper selects the reference openai-whisper model.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from .models import AudioDevice, Recording, DeviceType, RecordingState
 from .devices import AudioDeviceManager
 from .recorder import Recorder
@@ -13,49 +28,151 @@ from .transcriber import Transcriber
 class QuickScribeCore:
     """Main API for QuickScribe functionality"""
     
-    def __init__(self, output_dir=None):
+    def __init__(self, output_dir=None, model_size=None):
         self.device_manager = AudioDeviceManager()
         self.recorder = Recorder(output_dir)
-        self.transcriber = Transcriber()
+        self.transcriber = Transcriber(model_size)
         self.state = RecordingState.IDLE
+        self._executor = None
+        self._stream_futures = []
+        self._state_callback = None
+        
+    def set_state_callback(self, callback):
+        """Set callback run after the recording state or device changes"""
+        self._state_callback = callback
+    
+    def _notify_state(self):
+        if self._state_callback:
+            self._state_callback()
+    
+    def _set_state(self, state):
+        self.state = state
+        self._notify_state()
         
-    def get_devices(self):
-        """Get available audio devices"""
+    def get_devices(self, force_refresh=False):
+        """Get available audio devices (cached; force_refresh re-enumerates)"""
+        if force_refresh:
+            # A fresh PortAudio scan would close the recording stream
+            rescan = not self.recorder.is_recording
+            self.device_manager.invalidate_cache(rescan=rescan)
+            if rescan:
+                self._rebind_device()
         return self.device_manager.get_input_devices()
     
+    def _rebind_device(self):
+        """Point the recorder at its device's entry in a rescanned list
+        
+        A rescan renumbers devices, so the old id may now belong to another
+        device. The device is matched on name and host API instead; if it is
+        gone the recorder is left with no device.
+        """
+        current = self.recorder.current_device
+        if current is None:
+            return
+        self.recorder.set_device(self.device_manager.find_input_device(current.name, current.hostapi))
+        self._notify_state()
+    
     def set_device(self, device_id):
         """Set recording device by ID"""
         device = self.device_manager.get_device_by_id(device_id)
         if device and device.is_input:
             self.recorder.set_device(device)
+            self._notify_state()
             return True
         return False
     
     def start_recording(self):
         """Start recording"""
         try:
-            self.state = RecordingState.RECORDING
             filename = self.recorder.start_recording()
-            return True, filename
         except Exception as e:
-            self.state = RecordingState.ERROR
+            self._set_state(RecordingState.ERROR)
             return False, str(e)
+        self._set_state(RecordingState.RECORDING)
+        return True, filename
     
     def stop_recording(self):
         """Stop recording"""
-        self.state = RecordingState.IDLE
-        return self.recorder.stop_recording()
+        result = self.recorder.stop_recording()
+        self._set_state(RecordingState.IDLE)
+        return result
     
-    def get_recordings(self):
-        """Get list of recordings"""
-        return self.recorder.get_recordings()
+    def get_recordings(self, limit=None):
+        """Get list of recordings, newest first"""
+        return self.recorder.get_recordings(limit)
     
     def transcribe_recording(self, filepath, progress_callback=None):
         """Transcribe a recording"""
-        self.state = RecordingState.PROCESSING
-        success, result = self.transcriber.transcribe(filepath, progress_callback)
-        self.state = RecordingState.IDLE
-        return success, result
+        self._set_state(RecordingState.PROCESSING)
+        try:
+            return self.transcriber.transcribe(filepath, progress_callback)
+        finally:
+            self._set_state(RecordingState.IDLE)
+    
+    def transcribe_recordings(self, filepaths, progress_callback=None):
+        """Transcribe several recordings, loading the model only once"""
+        self._set_state(RecordingState.PROCESSING)
+        try:
+            return self.transcriber.transcribe_many(filepaths, progress_callback)
+        finally:
+            self._set_state(RecordingState.IDLE)
+    
+    def enable_streaming_transcription(self, chunk_seconds=30.0):
+        """Transcribe the next recording in chunks while it is still running
+        
+        Call before start_recording. Each chunk_seconds of audio is queued
+        on the background worker as soon as it is written, so by the time
+        recording stops only the last chunk is left;
+        finish_streaming_transcription then writes the transcript.
+        """
+        self._stream_futures = []
+        self.recorder.set_chunk_callback(self._on_audio_chunk, chunk_seconds)
+    
+    def _on_audio_chunk(self, chunk):
+        """Queue a recorded chunk for transcription (runs on the writer thread)"""
+        self._stream_futures.append(self._get_executor().submit(self.transcriber.transcribe_text, chunk))
+    
+    def finish_streaming_transcription(self, filepath, progress_callback=None):
+        """Wait for the streamed chunks and save the transcript for filepath
+        
+        Call after stop_recording; returns (success, transcript_path or error).
+        """
+        self.recorder.set_chunk_callback(None)
+        futures, self._stream_futures = self._stream_futures, []
+        self._set_state(RecordingState.PROCESSING)
+        try:
+            if progress_callback:
+                progress_callback(f"Finishing transcription ({len(futures)} chunk(s))...")
+            text = "".join(future.result() for future in futures)
+            transcript_file = self.transcriber.save_transcript(filepath, text)
+            if progress_callback:
+                progress_callback("Transcription complete!")
+            return True, transcript_file
+        except Exception as e:
+            return False, str(e)
+        finally:
+            self._set_state(RecordingState.IDLE)
+    
+    def preload_transcriber(self) -> Future:
+        """Load the Whisper model on the background worker
+        
+        Lets the model load while a recording is still running; a later
+        transcription waits for the load instead of starting another.
+        """
+        return self._get_executor().submit(self.transcriber.load_model)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the single background worker on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="quickscribe-transcribe")
+        return self._executor
+    
+    def shutdown(self, wait=True):
+        """Stop the background transcription worker"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
     
     @property
     def is_recording(self):
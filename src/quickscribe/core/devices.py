@@ -4,7 +4,8 @@ Audio device management for QuickScribe.
 
 import sounddevice as sd
 import os
-from typing import List, Optional
+import re
+from typing import Dict, List, Optional
 from .models import AudioDevice, DeviceType
 
 
@@ -13,26 +14,61 @@ class AudioDeviceManager:
     
     KNOWN_LOOPBACK_DEVICES = ['BlackHole', 'Soundflower', 'Loopback']
     KNOWN_APP_DEVICES = ['Teams', 'Zoom', 'Discord', 'Skype']
+    KNOWN_AGGREGATE_DEVICES = ['Aggregate', 'Multi-Output']
+    
+    # One case-insensitive pattern per keyword group
+    _LOOPBACK_RE = re.compile('|'.join(map(re.escape, KNOWN_LOOPBACK_DEVICES)), re.IGNORECASE)
+    _APP_RE = re.compile('|'.join(map(re.escape, KNOWN_APP_DEVICES)), re.IGNORECASE)
+    _AGGREGATE_RE = re.compile('|'.join(map(re.escape, KNOWN_AGGREGATE_DEVICES)), re.IGNORECASE)
+    
+    # Checked in priority order; the first group that matches wins
+    _TYPE_PATTERNS = (
+        (_LOOPBACK_RE, DeviceType.VIRTUAL_LOOPBACK),
+        (_APP_RE, DeviceType.APP_VIRTUAL),
+        (_AGGREGATE_RE, DeviceType.AGGREGATE),
+    )
     
     def __init__(self):
-        self._devices_cache = None
+        self._devices_cache: Optional[List[AudioDevice]] = None
+        self._by_id: Dict[int, AudioDevice] = {}
+        self._inputs: List[AudioDevice] = []
+        self._bh_configured: Optional[bool] = None
         
     def get_devices(self, force_refresh: bool = False) -> List[AudioDevice]:
         """Get all audio devices"""
         if force_refresh or self._devices_cache is None:
-            self._devices_cache = self._query_devices()
+            devices = self._query_devices()
+            # Index alongside the cache so lookups don't rescan the list
+            self._by_id = {d.id: d for d in devices}
+            self._inputs = [d for d in devices if d.is_input]
+            self._devices_cache = devices
         return self._devices_cache
     
+    def invalidate_cache(self, rescan: bool = False):
+        """Force the next lookup to re-enumerate devices
+        
+        PortAudio builds its device list once, when it is initialized, so
+        hotplugged devices only appear after rescan=True re-initializes
+        it. That tears down every stream, so only rescan with none open.
+        """
+        if rescan:
+            sd._terminate()
+            sd._initialize()
+        self._devices_cache = None
+        self._by_id = {}
+        self._inputs = []
+    
     def _query_devices(self) -> List[AudioDevice]:
         """Query system for audio devices"""
         devices = []
         sd_devices = sd.query_devices()
+        bh_configured = self._is_blackhole_configured()
         
         for idx, device in enumerate(sd_devices):
             device_type = self._determine_device_type(device['name'])
             needs_setup = (device_type == DeviceType.VIRTUAL_LOOPBACK and 
                           'BlackHole' in device['name'] and 
-                          not self._is_blackhole_configured())
+                          not bh_configured)
             
             audio_device = AudioDevice(
                 id=idx,
@@ -42,7 +78,8 @@ class AudioDeviceManager:
                 sample_rate=device['default_samplerate'],
                 is_default=device.get('default_input', False),
                 device_type=device_type,
-                needs_setup=needs_setup
+                needs_setup=needs_setup,
+                hostapi=device.get('hostapi', 0)
             )
             devices.append(audio_device)
         
@@ -50,19 +87,9 @@ class AudioDeviceManager:
     
     def _determine_device_type(self, device_name: str) -> DeviceType:
         """Determine the type of audio device based on its name"""
-        # Check for loopback devices
-        for loopback in self.KNOWN_LOOPBACK_DEVICES:
-            if loopback.lower() in device_name.lower():
-                return DeviceType.VIRTUAL_LOOPBACK
-        
-        # Check for app virtual devices
-        for app in self.KNOWN_APP_DEVICES:
-            if app.lower() in device_name.lower():
-                return DeviceType.APP_VIRTUAL
-        
-        # Check for aggregate devices
-        if 'aggregate' in device_name.lower() or 'multi-output' in device_name.lower():
-            return DeviceType.AGGREGATE
+        for pattern, device_type in self._TYPE_PATTERNS:
+            if pattern.search(device_name):
+                return device_type
         
         # Default to physical input
         return DeviceType.PHYSICAL_INPUT
@@ -70,25 +97,38 @@ class AudioDeviceManager:
     def _is_blackhole_configured(self) -> bool:
         """Check if BlackHole is properly configured"""
         # This is a simplified check - could be expanded
-        return os.path.exists(os.path.expanduser("~/Library/Audio/Plug-Ins/HAL/BlackHole.driver"))
+        # The driver path doesn't change during a run, so stat it only once
+        if self._bh_configured is None:
+            self._bh_configured = os.path.exists(
+                os.path.expanduser("~/Library/Audio/Plug-Ins/HAL/BlackHole.driver"))
+        return self._bh_configured
     
     def get_device_by_id(self, device_id: int) -> Optional[AudioDevice]:
         """Get a specific device by ID"""
-        devices = self.get_devices()
-        for device in devices:
-            if device.id == device_id:
+        self.get_devices()
+        return self._by_id.get(device_id)
+    
+    def find_input_device(self, name: str, hostapi: int) -> Optional[AudioDevice]:
+        """Find an input device by name and host API
+        
+        Ids are PortAudio indexes and change when it rescans, so this is
+        how a device is found again afterwards.
+        """
+        for device in self.get_input_devices():
+            if device.name == name and device.hostapi == hostapi:
                 return device
         return None
     
     def get_input_devices(self) -> List[AudioDevice]:
         """Get only input-capable devices"""
-        return [d for d in self.get_devices() if d.is_input]
+        self.get_devices()
+        return self._inputs
     
     def get_default_input_device(self) -> Optional[AudioDevice]:
         """Get the default input device"""
-        for device in self.get_devices():
-            if device.is_default and device.is_input:
+        input_devices = self.get_input_devices()
+        for device in input_devices:
+            if device.is_default:
                 return device
         # Fallback to first input device
-        input_devices = self.get_input_devices()
         return input_devices[0] if input_devices else None
\ No newline at end of file
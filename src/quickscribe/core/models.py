@@ -37,6 +37,7 @@ class AudioDevice:
     device_type: DeviceType
     is_available: bool = True
     needs_setup: bool = False
+    hostapi: int = 0  # PortAudio host API index; with name, identifies a device across rescans
 
     @property
     def is_input(self) -> bool:
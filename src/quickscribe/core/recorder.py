@@ -7,8 +7,12 @@ import sounddevice as sd
 import soundfile as sf
 import numpy as np
 from datetime import datetime
-from typing import List, Optional, Tuple, Callable
+from typing import Callable, Dict, List, Optional, Tuple
+import heapq
+import json
+import math
 import os
+import tempfile
 import threading
 import queue
 
@@ -18,20 +22,54 @@ from .models import AudioDevice, Recording, DeviceType
 class Recorder:
     """Core recording functionality"""
     
-    def __init__(self, output_dir: Optional[str] = None):
+    # Filename suffix -> device label, checked in order
+    _DEVICE_SUFFIX_MAP = {"_system": "System Audio", "_app": "App Audio"}
+    
+    # Per-recording metadata cache kept alongside the recordings
+    INDEX_FILENAME = ".index.json"
+    
+    def __init__(self, output_dir: Optional[str] = None, sample_rate: int = 16000):
         if output_dir is None:
             output_dir = os.path.expanduser("~/.quickscribe")
         self.output_dir = output_dir
-        self.sample_rate = 44100
+        # Whisper works on 16 kHz audio, so capture at that rate by default;
+        # PortAudio/CoreAudio resamples in the driver if the device differs
+        self.sample_rate = sample_rate
         self.channels = 1
+        self.block_duration = 0.02  # seconds of audio per callback
+        self.subtype = 'PCM_16'  # 16-bit is plenty for speech; half the size of FLOAT
         self.is_recording = False
         self.current_device: Optional[AudioDevice] = None
         self.current_filename: Optional[str] = None
-        self._audio_queue = queue.Queue()
-        self._recording_thread: Optional[threading.Thread] = None
+        # Unbounded C-implemented queue: put_nowait from the audio callback never blocks
+        self._audio_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer_thread: Optional[threading.Thread] = None
         self._stream: Optional[sd.InputStream] = None
-        self._audio_data = []
+        self._sf: Optional[sf.SoundFile] = None
+        self._frames_written = 0
+        self._write_error: Optional[Exception] = None
+        # Preallocated staging ring between the audio callback and the writer
+        self._ring_seconds = 10
+        self._ring: Optional[np.ndarray] = None
+        self._ring_pos = 0
+        self._ring_queued = 0  # only touched by the audio callback
+        self._ring_written = 0  # only touched by the writer thread
         self._level_callback: Optional[Callable[[float], None]] = None
+        self.level_interval = 1 / 30  # seconds of audio per level report (~30 Hz)
+        # Sum of squares since the last report; only touched by the audio callback
+        self._level_ssq = 0.0
+        self._level_count = 0
+        self._level_frames = 0
+        self._level_queue: queue.Queue = queue.Queue(maxsize=4)
+        self._level_thread: Optional[threading.Thread] = None
+        self._priority_checked = False
+        # Optional consumer of the recorded audio in chunk_seconds pieces
+        self._chunk_callback: Optional[Callable[[np.ndarray], None]] = None
+        self.chunk_seconds = 30.0
+        self._chunk_parts: List[np.ndarray] = []
+        self._chunk_frames = 0
+        # In-process metadata cache keyed on (filepath, mtime, size), in front of the on-disk index
+        self._meta_cache: Dict[Tuple[str, float, int], dict] = {}
         
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
@@ -46,6 +84,19 @@ class Recorder:
         """Set callback for audio level updates"""
         self._level_callback = callback
     
+    def set_chunk_callback(self, callback: Optional[Callable[[np.ndarray], None]],
+                           chunk_seconds: float = 30.0):
+        """Set callback receiving the recorded audio in chunk_seconds pieces
+        
+        It runs on the writer thread, so it should hand the chunk off
+        rather than process it; the final partial chunk is delivered when
+        recording stops. Pass None to disable.
+        """
+        if self.is_recording:
+            raise RuntimeError("Cannot change chunk callback while recording")
+        self._chunk_callback = callback
+        self.chunk_seconds = chunk_seconds
+    
     def start_recording(self) -> str:
         """Start recording, returns filename"""
         if self.is_recording:
@@ -63,17 +114,58 @@ class Recorder:
             device_suffix = "_app"
         
         self.current_filename = f"meeting_{timestamp}{device_suffix}.wav"
+        filepath = os.path.join(self.output_dir, self.current_filename)
+        
+        # Stream straight to disk; a writer thread keeps file I/O off the audio callback
+        self._sf = sf.SoundFile(filepath, mode='w', samplerate=self.sample_rate,
+                                channels=self.channels, format='WAV', subtype=self.subtype)
+        self._frames_written = 0
+        self._write_error = None
+        self._chunk_parts = []
+        self._chunk_frames = 0
+        # Whole number of blocks, so blocks tile the ring with no tail left unused
+        blocksize = int(self.sample_rate * self.block_duration)
+        ring_blocks = max(2, int(self._ring_seconds / self.block_duration))
+        ring_shape = (ring_blocks * blocksize, self.channels)
+        if self._ring is None or self._ring.shape != ring_shape:
+            # Reused across recordings; touch every page now so the first
+            # pass through the ring doesn't page-fault in the audio callback
+            self._ring = np.empty(ring_shape, dtype=np.float32)
+            self._ring.fill(0.0)
+        self._ring_pos = 0
+        self._ring_queued = 0
+        self._ring_written = 0
+        self._writer_thread = threading.Thread(target=self._writer_worker, daemon=True)
+        self._writer_thread.start()
         self.is_recording = True
-        self._audio_data = []
+        
+        self._priority_checked = False
+        
+        # Level metering runs on its own thread, off the audio callback
+        self._level_ssq = 0.0
+        self._level_count = 0
+        self._level_frames = max(1, int(self.sample_rate * self.channels * self.level_interval))
+        self._level_thread = threading.Thread(target=self._level_worker, daemon=True)
+        self._level_thread.start()
         
         # Start audio stream
-        self._stream = sd.InputStream(
-            device=self.current_device.id,
-            channels=self.channels,
-            samplerate=self.sample_rate,
-            callback=self._audio_callback
-        )
-        self._stream.start()
+        try:
+            self._stream = sd.InputStream(
+                device=self.current_device.id,
+                channels=self.channels,
+                samplerate=self.sample_rate,
+                blocksize=blocksize,
+                latency='low',
+                dtype='float32',
+                callback=self._audio_callback
+            )
+            self._stream.start()
+        except Exception:
+            self.is_recording = False
+            self._stream = None
+            self._finish_writing()
+            os.remove(filepath)
+            raise
         
         return self.current_filename
     
@@ -90,71 +182,319 @@ class Recorder:
             self._stream.close()
             self._stream = None
         
-        # Save audio file
-        if self._audio_data:
-            audio_array = np.concatenate(self._audio_data, axis=0)
-            filepath = os.path.join(self.output_dir, self.current_filename)
-            sf.write(filepath, audio_array, self.sample_rate)
+        self._finish_writing()
+        
+        filepath = os.path.join(self.output_dir, self.current_filename)
+        if self._write_error is not None:
+            # Keep whatever made it to disk
+            return False, f"Failed to write audio: {self._write_error}"
+        if self._frames_written:
+            self._remember_recording(filepath)
             return True, filepath
         
+        os.remove(filepath)
         return False, "No audio data recorded"
     
+    def _remember_recording(self, filepath: str):
+        """Index a just-finished recording so listings never read its header"""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return
+        meta = {'mtime': stat.st_mtime, 'size': stat.st_size,
+                'duration': self._frames_written / self.sample_rate,
+                'device_name': self.current_device.name,
+                'device_type': self.current_device.device_type.value}
+        self._meta_cache[(filepath, stat.st_mtime, stat.st_size)] = meta
+        index = self._load_index()
+        index[os.path.basename(filepath)] = meta
+        self._save_index(index)
+    
     def _audio_callback(self, indata, frames, time, status):
         """Audio stream callback"""
+        if not self._priority_checked:
+            self._priority_checked = True
+            self._raise_callback_priority()
         if self.is_recording:
-            self._audio_data.append(indata.copy())
+            n = len(indata)
+            # PortAudio reuses indata between callbacks, so stage it in the ring
+            # and queue only its (start, length); blocks stay contiguous
+            ring_len = len(self._ring)
+            pending = self._ring_queued - self._ring_written
+            if pending + 2 * n <= ring_len:
+                start = self._ring_pos if self._ring_pos + n <= ring_len else 0
+                np.copyto(self._ring[start:start + n], indata)
+                self._ring_pos = start + n
+                self._ring_queued += n
+                self._audio_queue.put_nowait((start, n))
+            else:
+                # Writer has fallen far behind; don't overwrite unwritten audio
+                self._audio_queue.put_nowait(indata.copy())
             
-            # Calculate audio level for visualization
+            # Accumulate the sum of squares and hand it to the level worker once
+            # per level_interval of audio; drop it if the worker is behind
             if self._level_callback:
-                # RMS level in dB
-                rms = np.sqrt(np.mean(indata**2))
-                db = 20 * np.log10(rms) if rms > 0 else -60
-                self._level_callback(db)
+                # 1-D view + dot: one BLAS pass, no squared temporary
+                samples = indata.reshape(-1)
+                self._level_ssq += float(np.dot(samples, samples))
+                self._level_count += samples.size
+                if self._level_count >= self._level_frames:
+                    try:
+                        self._level_queue.put_nowait((self._level_ssq, self._level_count))
+                    except queue.Full:
+                        pass
+                    self._level_ssq = 0.0
+                    self._level_count = 0
+    
+    @staticmethod
+    def _raise_callback_priority():
+        """Move the calling (PortAudio callback) thread to SCHED_FIFO if allowed
+        
+        CoreAudio already runs its IO threads at realtime priority; on Linux
+        the host API thread usually doesn't, and this needs CAP_SYS_NICE or
+        an rtprio limit, so failure is silently ignored.
+        """
+        if not hasattr(os, "sched_setscheduler"):
+            return
+        try:
+            priority = min(10, os.sched_get_priority_max(os.SCHED_FIFO))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (OSError, AttributeError):
+            pass
+    
+    def _finish_writing(self):
+        """Stop the worker threads, flushing queued audio and closing the file"""
+        if self._level_thread:
+            self._put_level(None)
+            self._level_thread.join()
+            self._level_thread = None
+        
+        self._audio_queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+        self._sf.close()
+        self._sf = None
+    
+    def _writer_worker(self):
+        """Write queued audio blocks to the open file until told to stop"""
+        no_item = object()
+        pending = no_item
+        while True:
+            if pending is no_item:
+                item = self._audio_queue.get()
+            else:
+                item, pending = pending, no_item
+            if item is None:
+                if self._chunk_frames:
+                    self._emit_chunk()
+                break
+            if isinstance(item, tuple):
+                start, n = item
+                # Merge blocks that continue the same ring span into one write
+                while True:
+                    try:
+                        nxt = self._audio_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if isinstance(nxt, tuple) and nxt[0] == start + n:
+                        n += nxt[1]
+                    else:
+                        pending = nxt
+                        break
+                self._write(self._ring[start:start + n])
+                self._ring_written += n
+            else:
+                self._write(item)
+    
+    def _write(self, block: np.ndarray):
+        """Append a block to the file, remembering the first failure
+        
+        After a failure (e.g. disk full) blocks are still drained but
+        dropped, so the ring keeps freeing and memory stays bounded.
+        """
+        if self._write_error is not None:
+            return
+        try:
+            self._sf.write(block)
+            self._frames_written += len(block)
+        except Exception as e:
+            self._write_error = e
+            return
+        
+        if self._chunk_callback is not None:
+            # Copy: ring slots are reused once written
+            self._chunk_parts.append(block.copy())
+            self._chunk_frames += len(block)
+            if self._chunk_frames >= self.sample_rate * self.chunk_seconds:
+                self._emit_chunk()
     
-    def get_recordings(self) -> List[Recording]:
-        """Get list of recordings"""
+    def _emit_chunk(self):
+        """Pass the audio gathered since the last chunk to the chunk callback"""
+        chunk = np.concatenate(self._chunk_parts)
+        self._chunk_parts = []
+        self._chunk_frames = 0
+        try:
+            self._chunk_callback(chunk)
+        except Exception:
+            pass  # A failing consumer must not stop the recording
+    
+    def _put_level(self, item):
+        """Queue an item for the level worker, discarding the oldest if full"""
+        while True:
+            try:
+                self._level_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._level_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _level_worker(self):
+        """Convert queued sums of squares to dB and report them
+        
+        The audio callback already batches level_interval of audio per item,
+        so each item becomes one report.
+        """
+        while True:
+            item = self._level_queue.get()
+            if item is None:
+                break
+            ssq, count = item
+            
+            callback = self._level_callback
+            if callback and count:
+                # RMS level in dB: 20*log10(sqrt(x)) == 10*log10(x)
+                mean_sq = ssq / count
+                db = 10 * math.log10(mean_sq) if mean_sq > 0 else -60
+                callback(db)
+    
+    def get_recordings(self, limit: Optional[int] = None) -> List[Recording]:
+        """Get list of recordings, newest first (at most limit of them)"""
         recordings = []
         
         if not os.path.exists(self.output_dir):
             return recordings
         
-        for filename in sorted(os.listdir(self.output_dir), reverse=True):
-            if filename.endswith('.wav'):
-                filepath = os.path.join(self.output_dir, filename)
-                
-                # Get file info
-                stat = os.stat(filepath)
-                timestamp = datetime.fromtimestamp(stat.st_mtime)
-                
-                # Get duration
+        # One directory pass: DirEntry caches stat info, and transcript
+        # existence becomes a set lookup instead of a syscall per file
+        with os.scandir(self.output_dir) as it:
+            entries = list(it)
+        names = set()
+        transcript_names = set()
+        wav_entries = []
+        for entry in entries:
+            name = entry.name
+            names.add(name)
+            if name.endswith('_transcript.txt'):
+                transcript_names.add(name)
+                continue
+            stem, _, ext = name.rpartition('.')
+            if ext == 'wav' and stem:
+                wav_entries.append((entry, stem))
+        by_mtime = lambda item: item[0].stat().st_mtime
+        if limit is not None:
+            # Cap before the per-file header reads; a bounded heap avoids
+            # sorting every recording just to keep the newest few
+            wav_entries = heapq.nlargest(limit, wav_entries, key=by_mtime)
+        else:
+            wav_entries.sort(key=by_mtime, reverse=True)
+        
+        index = None  # Only loaded if the in-process cache misses
+        index_dirty = False
+        
+        for entry, stem in wav_entries:
+            filename = entry.name
+            filepath = entry.path
+            
+            # Get file info
+            stat = entry.stat()
+            timestamp = datetime.fromtimestamp(stat.st_mtime)
+            
+            # Reuse the cached metadata while the file is unchanged, otherwise
+            # read the duration from the header only
+            key = (filepath, stat.st_mtime, stat.st_size)
+            meta = self._meta_cache.get(key)
+            if meta is None:
+                if index is None:
+                    index = self._load_index()
+                cached = index.get(filename)
+                if cached and cached.get('mtime') == stat.st_mtime and cached.get('size') == stat.st_size:
+                    meta = cached
+                    self._meta_cache[key] = meta
+            if meta is None:
+                meta = {}
                 try:
-                    data, sr = sf.read(filepath)
-                    duration = len(data) / sr
+                    info = sf.info(filepath)
+                    meta = {'mtime': stat.st_mtime, 'size': stat.st_size,
+                            'duration': info.frames / info.samplerate}
+                    # Don't cache the file still being written
+                    if not (self.is_recording and filename == self.current_filename):
+                        self._meta_cache[key] = meta
+                        index[filename] = meta
+                        index_dirty = True
                 except:
-                    duration = 0
-                
-                # Check for transcript
-                transcript_path = filepath.replace('.wav', '_transcript.txt')
-                has_transcript = os.path.exists(transcript_path)
-                
-                # Determine device from filename
-                device_name = "Unknown"
-                if "_system" in filename:
-                    device_name = "System Audio"
-                elif "_app" in filename:
-                    device_name = "App Audio"
-                else:
-                    device_name = "Microphone"
-                
-                recording = Recording(
-                    filename=filename,
-                    filepath=filepath,
-                    duration=duration,
-                    timestamp=timestamp,
-                    device_name=device_name,
-                    has_transcript=has_transcript,
-                    transcript_path=transcript_path if has_transcript else None
-                )
-                recordings.append(recording)
-        
-        return recordings
\ No newline at end of file
+                    pass
+            duration = meta.get('duration', 0)
+            
+            # Check for transcript
+            transcript_name = stem + '_transcript.txt'
+            transcript_path = os.path.join(self.output_dir, transcript_name)
+            has_transcript = transcript_name in transcript_names
+            
+            # Device recorded at stop time, else inferred from the filename
+            device_name = meta.get('device_name') or next(
+                (label for suffix, label in self._DEVICE_SUFFIX_MAP.items() if suffix in stem),
+                "Microphone")
+            
+            recording = Recording(
+                filename=filename,
+                filepath=filepath,
+                duration=duration,
+                timestamp=timestamp,
+                device_name=device_name,
+                has_transcript=has_transcript,
+                transcript_path=transcript_path if has_transcript else None
+            )
+            recordings.append(recording)
+        
+        # Forget recordings that have been deleted
+        if index is not None:
+            for name in [name for name in index if name not in names]:
+                del index[name]
+                index_dirty = True
+        
+        if index_dirty:
+            self._save_index(index)
+        
+        return recordings
+    
+    def _load_index(self) -> dict:
+        """Load the recording metadata index, empty if missing or unreadable"""
+        try:
+            with open(os.path.join(self.output_dir, self.INDEX_FILENAME), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self, index: dict):
+        """Atomically write the recording metadata index"""
+        path = os.path.join(self.output_dir, self.INDEX_FILENAME)
+        tmp_path = None
+        try:
+            # A unique temp file, so concurrent writers (CLI, TUI, worker)
+            # never share one before the rename
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.output_dir,
+                                             prefix=f"{self.INDEX_FILENAME}.",
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(index, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The index is only a cache
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
\ No newline at end of file
@@ -1,68 +1,379 @@
 #!/usr/bin/env python3
 """
 Transcriber module - Handles transcription using Whisper AI
+
+Two backends are supported: "faster-whisper" (CTranslate2, int8 on CPU,
+the default) and "whisper" (the reference openai-whisper PyTorch model).
+
+torch, whisper and faster_whisper are imported only when a model is
+loaded or run, so importing this module stays cheap.
 """
 
+import bisect
 import os
 import threading
-import whisper
+import numpy as np
+import soundfile as sf
 import warnings
 from datetime import datetime
-from typing import Optional, Callable, Tuple
+from typing import Dict, List, Optional, Callable, Tuple, Union
+
+
+BACKENDS = ("faster-whisper", "whisper")
+
+# Backend used when none is given; QUICKSCRIBE_BACKEND=whisper switches to
+# openai-whisper, e.g. to compare transcript quality
+DEFAULT_BACKEND = "faster-whisper"
+
+# Whisper's native input rate; in-memory audio must already be at this rate
+WHISPER_SAMPLE_RATE = 16000
+
+# Model size used when none is given; "tiny" keeps the TUI responsive
+DEFAULT_MODEL_SIZE = "tiny"
+
+# Language used when none is given; pinning it skips language detection.
+# QUICKSCRIBE_LANGUAGE=auto restores Whisper's auto-detection
+DEFAULT_LANGUAGE = "en"
+
+# Quantized openai-whisper models are cached here between runs
+MODEL_CACHE_DIR = os.path.expanduser("~/.quickscribe/cache")
+
+# torch.compile's inductor cache; compiled kernels are reused between runs
+COMPILE_CACHE_DIR = os.path.expanduser("~/.quickscribe/compiled")
+
+# Silero VAD settings: gaps of silence shorter than this stay inside a segment
+VAD_PARAMETERS = {"min_silence_duration_ms": 500}
+
+# save_transcript's metadata header is TRANSCRIPT_HEADER_LINES lines long
+# and ends with this separator (a blank line follows before the text)
+TRANSCRIPT_SEPARATOR = "-" * 50
+TRANSCRIPT_HEADER_LINES = 3
+
+# Inference threads: every core but one, leaving room for audio and the UI
+CPU_THREADS = max(1, (os.cpu_count() or 1) - 1)
+
+_torch_threads_configured = False
+
+
+def _configure_torch_threads():
+    """Size torch's thread pools once per process"""
+    global _torch_threads_configured
+    if _torch_threads_configured:
+        return
+    _torch_threads_configured = True
+    import torch
+    torch.set_num_threads(CPU_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Already fixed once parallel work has started
+
+
+def _select_device() -> str:
+    """Pick the torch device for openai-whisper
+    
+    MPS is deliberately skipped: whisper's sparse alignment_heads buffer
+    can't be moved there, so load_model(device="mps") fails, and CPU also
+    gets the int8 quantized model.
+    """
+    import torch
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _select_ct2_device() -> str:
+    """Pick the CTranslate2 device (no MPS support there)"""
+    import ctranslate2
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
 
 
 class Transcriber:
     """Handles transcription using Whisper"""
     
-    def __init__(self, model_size: str = "base"):
+    # Loaded models shared by every Transcriber, keyed on
+    # (backend, model_size, device, quantized, compiled)
+    _MODEL_CACHE: Dict[Tuple[str, str, str, bool, bool], object] = {}
+    _CACHE_LOCK = threading.Lock()
+    
+    def __init__(self,
+                 model_size: Optional[str] = None,
+                 language: Optional[str] = None,
+                 fp16: Optional[bool] = None,
+                 fast: bool = True,
+                 backend: Optional[str] = None,
+                 quantize: bool = True,
+                 vad: bool = True,
+                 torch_compile: Optional[bool] = None,
+                 timestamps: bool = False):
+        if backend is None:
+            backend = os.environ.get("QUICKSCRIBE_BACKEND", DEFAULT_BACKEND)
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        self.backend = backend
+        if model_size is None:
+            model_size = os.environ.get("QUICKSCRIBE_MODEL", DEFAULT_MODEL_SIZE)
         self.model_size = model_size
+        if language is None:
+            language = os.environ.get("QUICKSCRIBE_LANGUAGE", DEFAULT_LANGUAGE)
+        self.language = None if language == "auto" else language  # None lets Whisper auto-detect
+        self.fp16 = fp16  # None means FP16 on any non-CPU device
+        self.fast = fast  # Greedy, temperature-0 decoding instead of beam search
+        self.quantize = quantize  # int8 Linear layers for openai-whisper on CPU
+        self.vad = vad  # Drop silence with Silero VAD before decoding
+        if torch_compile is None:
+            torch_compile = os.environ.get("QUICKSCRIBE_TORCH_COMPILE") == "1"
+        self.torch_compile = torch_compile  # torch.compile the openai-whisper encoder (opt-in)
+        self.timestamps = timestamps  # Prefix each segment with its start time
         self.model = None
+        self.device: Optional[str] = None
         self._load_lock = threading.Lock()
     
     def load_model(self, progress_callback: Optional[Callable[[str], None]] = None):
         """Load Whisper model"""
         with self._load_lock:
             if self.model is None:
-                if progress_callback:
-                    progress_callback("Loading Whisper model...")
-                self.model = whisper.load_model(self.model_size)
+                if self.backend == "faster-whisper":
+                    device = _select_ct2_device()
+                else:
+                    device = _select_device()
+                quantized = self.quantize and self.backend == "whisper" and device == "cpu"
+                compiled = self.torch_compile and self.backend == "whisper" and not quantized
+                key = (self.backend, self.model_size, device, quantized, compiled)
+                with Transcriber._CACHE_LOCK:
+                    model = Transcriber._MODEL_CACHE.get(key)
+                    if model is None:
+                        if progress_callback:
+                            progress_callback("Loading Whisper model...")
+                        if quantized:
+                            model = self._load_quantized_model()
+                        else:
+                            model = self._create_model(device)
+                            if compiled:
+                                model = self._compile_model(model, device)
+                        Transcriber._MODEL_CACHE[key] = model
+                self.model = model
+                self.device = device
                 if progress_callback:
                     progress_callback("Model loaded!")
     
+    def _create_model(self, device: str):
+        """Instantiate the backend model on the given device"""
+        if self.backend == "faster-whisper":
+            from faster_whisper import WhisperModel
+            # int8 weights everywhere; FP16 activations where the GPU has them
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+            return WhisperModel(self.model_size, device=device, compute_type=compute_type,
+                                cpu_threads=CPU_THREADS)
+        import whisper
+        _configure_torch_threads()
+        return whisper.load_model(self.model_size, device=device).eval()
+    
+    def _compile_model(self, model, device: str):
+        """Compile the openai-whisper encoder with torch.compile
+        
+        The encoder always sees a fixed 30 s mel window, so it compiles to
+        one static graph; the decoder's growing sequence and kv-cache hooks
+        would keep recompiling, so it stays eager. torch.compile is lazy,
+        so a warm-up pass over a silent window compiles it here, and the
+        inductor cache under COMPILE_CACHE_DIR makes later processes reuse
+        the kernels. If compilation fails the eager encoder is kept.
+        """
+        import torch
+        if not hasattr(torch, "compile"):
+            return model
+        os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", COMPILE_CACHE_DIR)
+        mode = "reduce-overhead" if device == "cuda" else "default"
+        eager = model.encoder
+        fp16 = self.fp16 if self.fp16 is not None else device != "cpu"
+        window = torch.zeros(1, model.dims.n_mels, 2 * model.dims.n_audio_ctx, device=device,
+                             dtype=torch.float16 if fp16 else torch.float32)
+        try:
+            model.encoder = torch.compile(eager, mode=mode)
+            with torch.no_grad():
+                model.encoder(window)
+        except Exception:
+            model.encoder = eager  # Unsupported platform/toolchain; eager is still correct
+        return model
+    
+    def _load_quantized_model(self):
+        """Load an int8 dynamically quantized openai-whisper model for CPU
+        
+        The quantized module is saved under MODEL_CACHE_DIR so later runs
+        skip both the FP32 load and the quantization pass.
+        """
+        import torch
+        import whisper
+        cache_path = os.path.join(
+            MODEL_CACHE_DIR, f"whisper-{self.model_size}-int8-torch{torch.__version__}.pt")
+        if os.path.exists(cache_path):
+            try:
+                _configure_torch_threads()
+                return torch.load(cache_path, weights_only=False).eval()
+            except Exception:
+                pass  # Stale or corrupt cache, rebuild it below
+        
+        _configure_torch_threads()
+        model = whisper.load_model(self.model_size, device="cpu").eval()
+        # whisper.model.Linear only adds a dtype cast to forward(), which is a
+        # no-op in FP32; quantize_dynamic only swaps exact nn.Linear modules
+        for module in model.modules():
+            if isinstance(module, torch.nn.Linear):
+                module.__class__ = torch.nn.Linear
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        
+        try:
+            os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+            torch.save(model, cache_path)
+        except Exception:
+            pass  # Caching is best-effort
+        return model
+    
+    def _run_model(self, audio: Union[str, np.ndarray], timestamps: Optional[bool] = None) -> str:
+        """Run the loaded model over an audio file or array and return the text"""
+        if timestamps is None:
+            timestamps = self.timestamps
+        if self.backend == "faster-whisper":
+            options = {
+                "language": self.language,
+                "task": "transcribe",
+                "condition_on_previous_text": False,
+                "vad_filter": self.vad,
+            }
+            if self.vad:
+                options["vad_parameters"] = VAD_PARAMETERS
+            if self.fast:
+                # A single temperature also disables the fallback re-decodes
+                options.update(beam_size=1, best_of=1, temperature=0.0)
+            segments, _info = self.model.transcribe(audio, **options)
+            # Segments are generated lazily; joining them runs the decode.
+            # Their timestamps are already mapped back past the VAD cuts
+            if timestamps:
+                return self._format_segments((segment.start, segment.text) for segment in segments)
+            return "".join(segment.text for segment in segments)
+        
+        offsets = [(0, 0)]
+        if self.vad:
+            audio, offsets = self._speech_only(audio)
+            if audio.size == 0:
+                return ""
+        
+        import torch
+        fp16 = self.fp16 if self.fp16 is not None else self.device != "cpu"
+        options = {
+            "fp16": fp16,
+            "language": self.language,
+            "task": "transcribe",
+            "condition_on_previous_text": False,
+        }
+        if self.fast:
+            # A single temperature also disables the fallback re-decodes
+            options.update(beam_size=1, best_of=1, temperature=0.0)
+        
+        # Simple transcription with just warning suppression; inference_mode
+        # skips autograd bookkeeping on every op
+        with warnings.catch_warnings(), torch.inference_mode():
+            warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
+            result = self.model.transcribe(audio, **options)
+        if timestamps:
+            return self._format_segments((self._original_time(segment["start"], offsets), segment["text"])
+                                         for segment in result["segments"])
+        return result["text"]
+    
+    @staticmethod
+    def _original_time(seconds: float, offsets: List[Tuple[int, int]]) -> float:
+        """Map a time in VAD-trimmed audio back to the original recording
+        
+        offsets holds (original_start, trimmed_start) sample pairs, one per
+        kept speech region, in order.
+        """
+        sample = seconds * WHISPER_SAMPLE_RATE
+        i = max(0, bisect.bisect_right([trimmed for _, trimmed in offsets], sample) - 1)
+        original, trimmed = offsets[i]
+        return (original + sample - trimmed) / WHISPER_SAMPLE_RATE
+    
+    @staticmethod
+    def _format_segments(segments) -> str:
+        """One "[HH:MM:SS] text" line per (start_seconds, text) segment"""
+        lines = []
+        for start, text in segments:
+            minutes, secs = divmod(int(start), 60)
+            hours, minutes = divmod(minutes, 60)
+            lines.append(f"[{hours:02d}:{minutes:02d}:{secs:02d}] {text.strip()}")
+        return "\n".join(lines)
+    
+    def _speech_only(self, audio: Union[str, np.ndarray]) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+        """Cut audio down to its speech regions for openai-whisper
+        
+        Uses the Silero VAD bundled with faster-whisper; without it the
+        audio is returned whole. Also returns the (original_start,
+        trimmed_start) sample offset of each kept region, for mapping
+        segment timestamps back with _original_time.
+        """
+        try:
+            from faster_whisper.audio import decode_audio
+            from faster_whisper.vad import VadOptions, get_speech_timestamps
+        except ImportError:
+            if not isinstance(audio, np.ndarray):
+                import whisper
+                audio = whisper.load_audio(audio)
+            return audio, [(0, 0)]
+        
+        if isinstance(audio, str):
+            audio = decode_audio(audio, sampling_rate=WHISPER_SAMPLE_RATE)
+        speech = get_speech_timestamps(audio, vad_options=VadOptions(**VAD_PARAMETERS))
+        if not speech:
+            return audio[:0], [(0, 0)]
+        offsets = []
+        trimmed = 0
+        for ts in speech:
+            offsets.append((ts["start"], trimmed))
+            trimmed += ts["end"] - ts["start"]
+        return np.concatenate([audio[ts["start"]:ts["end"]] for ts in speech]), offsets
+    
+    def _load_audio(self, audio_file: str) -> Optional[np.ndarray]:
+        """Read a file already at WHISPER_SAMPLE_RATE with libsndfile
+        
+        QuickScribe records at that rate, so its WAVs need no resampling
+        and skip openai-whisper's ffmpeg subprocess. Other rates, or formats
+        libsndfile can't read, return None and go to the backend's decoder.
+        """
+        try:
+            if sf.info(audio_file).samplerate != WHISPER_SAMPLE_RATE:
+                return None
+            audio, _sr = sf.read(audio_file, dtype='float32')
+        except Exception:
+            return None
+        return audio
+    
     def transcribe(self, 
                    audio_file: str, 
-                   progress_callback: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
-        """Transcribe an audio file"""
-        if not self.model:
-            self.load_model(progress_callback)
+                   progress_callback: Optional[Callable[[str], None]] = None,
+                   write_metadata: bool = True,
+                   audio: Optional[np.ndarray] = None) -> Tuple[bool, str]:
+        """Transcribe an audio file
+        
+        With write_metadata=False the transcript file holds only the text,
+        without the filename/timestamp header.
         
+        If audio is given (float samples at WHISPER_SAMPLE_RATE, e.g. still
+        in memory from a recording), it is transcribed directly and the file
+        is not decoded again; audio_file then only names the transcript.
+        """
         try:
+            if not self.model:
+                self.load_model(progress_callback)
+            
             if progress_callback:
                 progress_callback("Transcribing...")
             
-            # Simple transcription with just warning suppression
-            with warnings.catch_warnings():
-                warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
-                result = self.model.transcribe(audio_file)
-            text = result["text"]
-            
-            # Save transcript with explicit UTF-8 encoding and error handling
-            transcript_file = audio_file.replace('.wav', '_transcript.txt')
-            
-            # Ensure text is properly encoded
-            if isinstance(text, bytes):
-                text = text.decode('utf-8', errors='replace')
-            elif not isinstance(text, str):
-                text = str(text)
-            
-            # Clean text of any problematic characters
-            text = text.encode('utf-8', errors='replace').decode('utf-8')
+            if audio is None:
+                # Decode in-process when possible rather than via the backend's decoder
+                audio = self._load_audio(audio_file)
+            if audio is not None:
+                text = self._run_model(self._prepare_audio(audio))
+            else:
+                text = self._run_model(audio_file)
             
-            with open(transcript_file, 'w', encoding='utf-8', errors='replace') as f:
-                f.write(f"Transcript for: {os.path.basename(audio_file)}\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("-" * 50 + "\n\n")
-                f.write(text)
+            transcript_file = self.save_transcript(audio_file, text, write_metadata)
             
             if progress_callback:
                 progress_callback("Transcription complete!")
@@ -70,4 +381,60 @@ class Transcriber:
             return True, transcript_file
             
         except Exception as e:
-            return False, str(e)
\ No newline at end of file
+            return False, str(e)
+    
+    def transcribe_text(self, audio: np.ndarray) -> str:
+        """Transcribe in-memory audio (at WHISPER_SAMPLE_RATE) and return the plain text
+        
+        Nothing is written to disk; used for chunks of a recording that is
+        still in progress.
+        """
+        if not self.model:
+            self.load_model()
+        return self._run_model(self._prepare_audio(audio), timestamps=False)
+    
+    @staticmethod
+    def _prepare_audio(audio: np.ndarray) -> np.ndarray:
+        """Whisper wants mono float32; downmix and convert only if needed"""
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        return np.ascontiguousarray(audio, dtype=np.float32)
+    
+    def save_transcript(self, audio_file: str, text, write_metadata: bool = True) -> str:
+        """Write the transcript next to audio_file and return its path"""
+        # Save transcript with explicit UTF-8 encoding
+        transcript_file = os.path.splitext(audio_file)[0] + '_transcript.txt'
+        
+        # Ensure text is properly encoded
+        if isinstance(text, bytes):
+            text = text.decode('utf-8', errors='replace')
+        elif not isinstance(text, str):
+            text = str(text)
+        
+        if write_metadata:
+            text = (f"Transcript for: {os.path.basename(audio_file)}\n"
+                    f"Generated: {datetime.now():%Y-%m-%d %H:%M:%S}\n"
+                    f"{TRANSCRIPT_SEPARATOR}\n\n"
+                    f"{text}")
+        
+        with open(transcript_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return transcript_file
+    
+    def transcribe_many(self,
+                        audio_files: List[str],
+                        progress_callback: Optional[Callable[[str], None]] = None,
+                        write_metadata: bool = True) -> List[Tuple[bool, str]]:
+        """Transcribe several files with a single model load
+        
+        Returns one (success, result) tuple per file, in order; a failure
+        doesn't stop the remaining files.
+        """
+        if not self.model:
+            try:
+                self.load_model(progress_callback)
+            except Exception as e:
+                # No file can be transcribed; report it for each, once
+                return [(False, str(e))] * len(audio_files)
+        return [self.transcribe(audio_file, progress_callback, write_metadata)
+                for audio_file in audio_files]
@@ -4,12 +4,15 @@ QuickScribe CLI - Non-interactive command-line interface
 """
 
 import argparse
+import glob
+import itertools
 import sys
 import os
-import time
 import signal
+import threading
 from pathlib import Path
 from ..core import QuickScribeCore, DeviceType
+from ..core.transcriber import TRANSCRIPT_HEADER_LINES, TRANSCRIPT_SEPARATOR
 
 
 class QuickScribeCLI:
@@ -20,12 +23,8 @@ class QuickScribeCLI:
             print("Loading QuickScribe...", file=sys.stderr)
         self.core = QuickScribeCore()
         self.quiet = quiet
-        
-        # Load Whisper model
-        if not quiet:
-            self.core.transcriber.load_model(lambda msg: print(msg, file=sys.stderr))
-        else:
-            self.core.transcriber.load_model(lambda msg: None)
+        # The Whisper model is loaded on first transcription, not here, so
+        # devices/list/show start instantly
     
     def log(self, message, error=False):
         """Print message unless in quiet mode"""
@@ -70,7 +69,8 @@ class QuickScribeCLI:
                 type_marker = f" [{device.device_type.value}]" if device.device_type != DeviceType.PHYSICAL_INPUT else ""
                 print(f"{device.id}: {device.name} ({device.channels_in}ch){type_marker}{status}{default_marker}")
     
-    def record(self, device_id=None, output_file=None, duration=None, auto_transcribe=False):
+    def record(self, device_id=None, output_file=None, duration=None, auto_transcribe=False,
+               stream_transcribe=False):
         """Start recording"""
         # Set device if specified
         if device_id is not None:
@@ -97,58 +97,76 @@ class QuickScribeCLI:
         if output_file:
             self.log("Warning: Custom output file names not yet supported in new core", error=True)
         
+        if stream_transcribe:
+            # Transcribe 30 s chunks on a background worker as they are recorded
+            self.core.enable_streaming_transcription()
+        
         success, result = self.core.start_recording()
         if not success:
             self.log(f"Failed to start recording: {result}", error=True)
             return False
         
         filename = result
+        if auto_transcribe:
+            # Load Whisper while recording rather than after it
+            self.core.preload_transcriber()
         # For compatibility, we need to get the full path
         filepath = os.path.join(self.core.recorder.output_dir, filename)
         self.log(f"Recording to: {filepath}")
         
-        # Set up signal handler for graceful shutdown
+        # Block in the kernel until Ctrl+C/SIGTERM or the duration elapses,
+        # rather than waking up to poll
+        stop_event = threading.Event()
+        
         def signal_handler(signum, frame):
-            self.log("\nStopping recording...")
-            success, result = self.core.stop_recording()
-            if success:
-                self.log(f"Recording saved: {result}")
-                if auto_transcribe:
-                    self.transcribe(result)
-            else:
-                self.log(f"Error stopping recording: {result}", error=True)
-            sys.exit(0)
+            stop_event.set()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        previous_sigint = signal.signal(signal.SIGINT, signal_handler)
+        previous_sigterm = signal.signal(signal.SIGTERM, signal_handler)
         
         # Record for specified duration or until interrupted
-        if duration:
-            self.log(f"Recording for {duration} seconds... (Ctrl+C to stop early)")
-            time.sleep(duration)
-            success, result = self.core.stop_recording()
-            if success:
-                self.log(f"Recording completed: {result}")
-                if auto_transcribe:
-                    self.transcribe(result)
-                return True
+        try:
+            if duration:
+                self.log(f"Recording for {duration} seconds... (Ctrl+C to stop early)")
+                interrupted = stop_event.wait(timeout=duration)
             else:
-                self.log(f"Error stopping recording: {result}", error=True)
-                return False
+                self.log("Recording... (Ctrl+C to stop)")
+                interrupted = stop_event.wait()
+        finally:
+            # Ctrl+C during transcription should interrupt as usual again
+            signal.signal(signal.SIGINT, previous_sigint)
+            signal.signal(signal.SIGTERM, previous_sigterm)
+        
+        if interrupted:
+            self.log("\nStopping recording...")
+        success, result = self.core.stop_recording()
+        if success:
+            self.log(f"Recording {'saved' if interrupted else 'completed'}: {result}")
+            if stream_transcribe:
+                self.finish_streaming_transcription(result)
+            elif auto_transcribe:
+                self.transcribe(result)
+            return True
         else:
-            self.log("Recording... (Ctrl+C to stop)")
-            try:
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                pass  # Signal handler will take care of stopping
+            self.log(f"Error stopping recording: {result}", error=True)
+            return False
+    
+    def finish_streaming_transcription(self, filepath):
+        """Collect the chunks transcribed during recording into a transcript"""
+        def progress(msg):
+            if not self.quiet:
+                self.log(f"  {msg}")
+        
+        success, result = self.core.finish_streaming_transcription(filepath, progress)
+        if success:
+            self.log(f"Transcript saved: {result}")
+        else:
+            self.log(f"Transcription failed: {result}", error=True)
+        return success
     
     def list_recordings(self, format_output="human", limit=None):
         """List recordings"""
-        recordings = self.core.get_recordings()
-        
-        if limit:
-            recordings = recordings[:limit]
+        recordings = self.core.get_recordings(limit or None)
         
         if format_output == "json":
             import json
@@ -180,7 +198,7 @@ class QuickScribeCLI:
                 timestamp = rec.timestamp.strftime("%Y-%m-%d %H:%M")
                 print(f"[{transcript}] {rec.filename} ({duration}) - {timestamp} - {rec.device_name}")
     
-    def transcribe(self, filepath, output_file=None):
+    def transcribe(self, filepath, output_file=None, timestamps=False):
         """Transcribe a recording"""
         if not os.path.exists(filepath):
             self.log(f"File not found: {filepath}", error=True)
@@ -197,6 +215,7 @@ class QuickScribeCLI:
         if output_file:
             self.log("Warning: Custom transcript output files not yet supported in new core", error=True)
         
+        self.core.transcriber.timestamps = timestamps
         success, result = self.core.transcribe_recording(filepath, progress)
         
         if success:
@@ -206,11 +225,46 @@ class QuickScribeCLI:
             self.log(f"Transcription failed: {result}", error=True)
             return False
     
+    def transcribe_batch(self, patterns):
+        """Transcribe several recordings with one model load"""
+        # Expand globs the shell left alone (e.g. quoted), keeping order
+        filepaths = []
+        for pattern in patterns:
+            matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+            for path in matches:
+                if path not in filepaths:
+                    filepaths.append(path)
+        
+        missing = [path for path in filepaths if not os.path.exists(path)]
+        for path in missing:
+            self.log(f"File not found: {path}", error=True)
+        filepaths = [path for path in filepaths if path not in missing]
+        if not filepaths:
+            self.log("No files to transcribe", error=True)
+            return False
+        
+        self.log(f"Transcribing {len(filepaths)} file(s)...")
+        
+        def progress(msg):
+            if not self.quiet:
+                self.log(f"  {msg}")
+        
+        results = self.core.transcribe_recordings(filepaths, progress)
+        
+        failed = 0
+        for path, (success, result) in zip(filepaths, results):
+            if success:
+                self.log(f"Transcript saved: {result}")
+            else:
+                failed += 1
+                self.log(f"Transcription failed for {os.path.basename(path)}: {result}", error=True)
+        return not failed and not missing
+    
     def show_transcript(self, filepath, lines=None):
         """Show transcript content"""
         # Find transcript file
         if filepath.endswith('.wav'):
-            transcript_path = filepath.replace('.wav', '_transcript.txt')
+            transcript_path = os.path.splitext(filepath)[0] + '_transcript.txt'
         else:
             transcript_path = filepath
         
@@ -219,25 +273,24 @@ class QuickScribeCLI:
             return False
         
         try:
-            # Try UTF-8 first, fallback if needed
-            try:
-                with open(transcript_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                with open(transcript_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                
-                # Skip header if present
-                if "-" * 50 in content:
-                    parts = content.split("-" * 50, 2)
-                    if len(parts) >= 2:
-                        content = parts[1].strip()
-                
+            # Stream the file; with --lines only the first N lines are read
+            with open(transcript_path, 'r', encoding='utf-8', errors='replace') as f:
+                # Skip header if present (a few lines ending in the separator)
+                head = list(itertools.islice(f, TRANSCRIPT_HEADER_LINES))
+                for i, line in enumerate(head):
+                    if line.rstrip('\n') == TRANSCRIPT_SEPARATOR:
+                        head = head[i + 1:]
+                        break
+                body = itertools.dropwhile(lambda line: not line.strip(), itertools.chain(head, f))
                 if lines:
-                    content_lines = content.split('\n')
-                    content = '\n'.join(content_lines[:lines])
+                    body = itertools.islice(body, lines)
                 
-                print(content)
+                line = "\n"
+                for n, line in enumerate(body):
+                    # Whisper text usually starts with a space
+                    sys.stdout.write(line.lstrip() if n == 0 else line)
+                if not line.endswith("\n"):
+                    sys.stdout.write("\n")
             return True
         except Exception as e:
             self.log(f"Error reading transcript: {e}", error=True)
@@ -252,6 +305,7 @@ def main():
                "  quickscribe record --duration 300 --auto-transcribe\n"
                "  quickscribe devices --format json\n"
                "  quickscribe transcribe recording.wav\n"
+               "  quickscribe transcribe-batch ~/.quickscribe/*.wav\n"
                "  quickscribe list --limit 5",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -272,6 +326,8 @@ def main():
     record_parser.add_argument("-t", "--duration", type=int, help="Recording duration in seconds")
     record_parser.add_argument("--auto-transcribe", action="store_true", 
                               help="Automatically transcribe after recording")
+    record_parser.add_argument("--stream-transcribe", action="store_true",
+                              help="Transcribe in 30 s chunks while recording (implies --auto-transcribe)")
     
     # List recordings command
     list_parser = subparsers.add_parser("list", help="List recordings")
@@ -283,6 +339,13 @@ def main():
     transcribe_parser = subparsers.add_parser("transcribe", help="Transcribe a recording")
     transcribe_parser.add_argument("file", help="Audio file to transcribe")
     transcribe_parser.add_argument("-o", "--output", help="Output transcript file")
+    transcribe_parser.add_argument("--timestamps", action="store_true",
+                                   help="Prefix each segment with its start time")
+    
+    # Batch transcribe command
+    batch_parser = subparsers.add_parser("transcribe-batch",
+                                         help="Transcribe several recordings with one model load")
+    batch_parser.add_argument("files", nargs="+", help="Audio files or glob patterns")
     
     # Show transcript command
     show_parser = subparsers.add_parser("show", help="Show transcript content")
@@ -306,7 +369,8 @@ def main():
                 device_id=args.device,
                 output_file=args.output,
                 duration=args.duration,
-                auto_transcribe=args.auto_transcribe
+                auto_transcribe=args.auto_transcribe or args.stream_transcribe,
+                stream_transcribe=args.stream_transcribe
             )
             sys.exit(0 if success else 1)
         
@@ -314,7 +378,11 @@ def main():
             cli.list_recordings(args.format, args.limit)
         
         elif args.command == "transcribe":
-            success = cli.transcribe(args.file, args.output)
+            success = cli.transcribe(args.file, args.output, args.timestamps)
+            sys.exit(0 if success else 1)
+        
+        elif args.command == "transcribe-batch":
+            success = cli.transcribe_batch(args.files)
             sys.exit(0 if success else 1)
         
         elif args.command == "show":
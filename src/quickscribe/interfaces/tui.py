@@ -5,130 +5,211 @@ Uses quickscribe_core for all business logic
 """
 
 from textual.app import App, ComposeResult
-from textual.widgets import Header, Footer, Button, Static, ListView, ListItem, Label, ProgressBar
-from textual.containers import Container, Vertical, ScrollableContainer
-from textual.reactive import reactive
+from textual.widgets import Header, Footer, Button, Static, ListView, ListItem, Label, Log, OptionList, ProgressBar
+from textual.widgets.option_list import Option
+from rich.style import Style
+from rich.text import Text
+from textual.containers import Container, Vertical
 from textual.message import Message
 from textual import events
-from textual.timer import Timer
 from textual.screen import ModalScreen
+from textual.timer import Timer
 
 from ..core import QuickScribeCore, AudioDevice, DeviceType, Recording
+from ..core.transcriber import TRANSCRIPT_HEADER_LINES, TRANSCRIPT_SEPARATOR
 from datetime import datetime
 import asyncio
 import functools
+import itertools
+import json
 import logging
+import sys
+import textwrap
+import time
 import traceback
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+
+# Device pane header, filled in by update_status
+_DEVICE_HEADER_FMT = "Audio Devices - Status: {status} - Selected: {device}"
+
+# Row suffix for each non-physical device type
+_TYPE_MARKER = {
+    DeviceType.VIRTUAL_LOOPBACK: "[LOOP]",
+    DeviceType.APP_VIRTUAL: "[APP]",
+    DeviceType.AGGREGATE: "[AGG]",
+}
 
 
 class DeviceItem(ListItem):
     """Custom list item for audio devices"""
     
+    __slots__ = ("device", "is_selected", "_body")
+    
     def __init__(self, device: AudioDevice, is_selected: bool = False) -> None:
         self.device = device
         self.is_selected = is_selected
+        self._body = self._format_body(device)
         super().__init__()
     
     def compose(self) -> ComposeResult:
         """Create device display"""
-        # Selection indicator
+        yield Label(self._display_text())
+    
+    def set_selected(self, is_selected: bool) -> None:
+        """Update the selection indicator in place"""
+        if is_selected == self.is_selected:
+            return
+        self.is_selected = is_selected
+        self._update_label()
+    
+    def set_device(self, device: AudioDevice, is_selected: bool) -> None:
+        """Show a re-enumerated device in place, re-rendering only if it changed"""
+        if device == self.device and is_selected == self.is_selected:
+            return
+        if device != self.device:
+            self.device = device
+            self._body = self._format_body(device)
+        self.is_selected = is_selected
+        self._update_label()
+    
+    def _update_label(self) -> None:
+        """Push the current text to the mounted label"""
+        if self.is_mounted:
+            self.query_one(Label).update(self._display_text())
+    
+    def _display_text(self) -> str:
+        """Build the row text from the selection glyph and the cached body"""
         selector = "●" if self.is_selected else "○"
-        
-        # Device type indicator
-        type_marker = ""
-        if self.device.device_type == DeviceType.VIRTUAL_LOOPBACK:
-            type_marker = "[LOOP]"
-        elif self.device.device_type == DeviceType.APP_VIRTUAL:
-            type_marker = "[APP]"
-        elif self.device.device_type == DeviceType.AGGREGATE:
-            type_marker = "[AGG]"
-        
+        return f"{selector} {self._body}"
+    
+    @staticmethod
+    def _format_body(device: AudioDevice) -> str:
+        """Format everything after the selection indicator"""
         # Status indicator
         status = ""
-        if self.device.needs_setup:
+        if device.needs_setup:
             status = " (setup needed)"
-        elif not self.device.is_available:
+        elif not device.is_available:
             status = " (unavailable)"
         
-        display_text = f"{selector} {self.device.name} ({self.device.channels_in}ch){type_marker}{status}"
-        yield Label(display_text)
+        type_marker = _TYPE_MARKER.get(device.device_type, "")
+        return f"{device.name} ({device.channels_in}ch){type_marker}{status}"
 
 
-class RecordingItem(ListItem):
-    """Custom list item for recordings"""
+def recording_prompt(recording: Recording) -> Text:
+    """Build the recordings list row for a recording"""
+    # Format duration
+    duration = f"{int(recording.duration // 60)}:{int(recording.duration % 60):02d}"
     
-    def __init__(self, recording: Recording) -> None:
-        self.recording = recording
-        super().__init__()
+    # Transcript indicator
+    transcript = "✓" if recording.has_transcript else "○"
     
-    def compose(self) -> ComposeResult:
-        """Create recording display"""
-        # Format duration
-        duration = f"{int(self.recording.duration // 60)}:{int(self.recording.duration % 60):02d}"
-        
-        # Transcript indicator
-        transcript = "✓" if self.recording.has_transcript else "○"
-        
-        # Format timestamp
-        time_str = self.recording.timestamp.strftime("%H:%M")
-        
-        # Use Rich markup-safe format
-        yield Label(
-            f"{transcript} {self.recording.filename} ({duration}) - {time_str}"
-        )
+    # Format timestamp
+    time_str = recording.timestamp.strftime("%H:%M")
+    
+    # Plain Text, so filenames are never parsed as markup
+    return Text(f"{transcript} {recording.filename} ({duration}) - {time_str}")
 
 
 class AudioLevelDisplay(Static):
     """Audio level meter display"""
     
-    level = reactive(-60.0)
+    __slots__ = ("level", "_last_update")
+    
+    # Minimum seconds between meter repaints (~15 Hz)
+    UPDATE_INTERVAL = 0.064
     
-    def render(self) -> str:
+    BAR_WIDTH = 40
+    # Full-width bars, sliced to length when rendering
+    _FILLED_BAR = '█' * BAR_WIDTH
+    _EMPTY_BAR = '░' * BAR_WIDTH
+    
+    _GREEN = Style(color="green")
+    _YELLOW = Style(color="yellow")
+    _RED = Style(color="red")
+    _DIM = Style(dim=True)
+    
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Plain attribute rather than a reactive: repaints are requested
+        # explicitly, and only at UPDATE_INTERVAL
+        self.level = -60.0
+        self._last_update = 0.0
+    
+    def render(self) -> Text:
         """Render the audio level meter"""
         # Convert dB to 0-1 range (-60dB to 0dB)
         normalized = max(0, min(1, (self.level + 60) / 60))
         
         # Create visual meter
-        bar_width = 40
-        filled = int(normalized * bar_width)
-        empty = bar_width - filled
+        filled = int(normalized * self.BAR_WIDTH)
+        empty = self.BAR_WIDTH - filled
         
         # Color based on level
         if normalized > 0.9:
-            bar_color = "red"
+            bar_style = self._RED
         elif normalized > 0.7:
-            bar_color = "yellow"
+            bar_style = self._YELLOW
         else:
-            bar_color = "green"
-        
-        meter = f"[{bar_color}]{'█' * filled}[/][dim]{'░' * empty}[/]"
-        
-        return f"Level: {meter} {self.level:.1f}dB"
+            bar_style = self._GREEN
+        
+        # Styled spans directly, so there's no markup to parse on each repaint
+        return Text.assemble(
+            "Level: ",
+            (self._FILLED_BAR[:filled], bar_style),
+            (self._EMPTY_BAR[:empty], self._DIM),
+            f" {self.level:.1f}dB",
+        )
     
     def update_level(self, level: float) -> None:
         """Update the audio level"""
         self.level = level
+        now = time.monotonic()
+        if now - self._last_update >= self.UPDATE_INTERVAL:
+            self._last_update = now
+            self.refresh()
 
 
 class TranscriptModal(ModalScreen):
     """Modal screen for viewing transcripts"""
     
-    def __init__(self, title: str, content: str) -> None:
+    def __init__(self, title: str, lines: List[str]) -> None:
         super().__init__()
         self.title = title
-        self.content = content
+        self.lines = lines
+        self._wrapped_width = 0
     
     def compose(self) -> ComposeResult:
         """Create the modal layout"""
         with Container(id="transcript-modal"):
             yield Label(self.title, id="transcript-title")
-            yield ScrollableContainer(
-                Static(self.content, id="transcript-content"),
-                id="transcript-container"
-            )
+            # Log draws only the lines in view, however long the transcript
+            yield Log(id="transcript-content", highlight=False, auto_scroll=False)
             yield Label("Press ESC or Q to close", id="transcript-help")
     
+    def on_mount(self) -> None:
+        """Fill the log once it has been laid out"""
+        self.call_after_refresh(self._fill)
+    
+    def on_resize(self, event) -> None:
+        """Re-wrap for the new width"""
+        self.call_after_refresh(self._fill)
+    
+    def _fill(self) -> None:
+        """Wrap the transcript to the log's width and load it"""
+        content = self.query_one("#transcript-content", Log)
+        # Log doesn't wrap, and transcripts are often a single long line
+        width = max(20, content.scrollable_content_region.width - 1)
+        if width == self._wrapped_width:
+            return
+        self._wrapped_width = width
+        content.clear()
+        content.write_lines(wrapped
+                            for line in self.lines
+                            for wrapped in (textwrap.wrap(line, width) or [""]))
+        content.scroll_home(animate=False)
+    
     def on_key(self, event) -> None:
         """Handle key presses"""
         if event.key in ("escape", "q"):
@@ -184,14 +265,10 @@ class QuickScribeTUI(App):
         margin-bottom: 1;
     }
     
-    #transcript-container {
+    #transcript-content {
         height: 1fr;
         border: solid $primary;
-        padding: 1;
-    }
-    
-    #transcript-content {
-        padding: 1;
+        padding: 0 1;
     }
     
     #transcript-help {
@@ -214,15 +291,48 @@ class QuickScribeTUI(App):
         ("q", "quit", "Quit"),
     ]
     
+    # Most rows mounted in one go while refreshing the device list
+    MOUNT_BATCH = 8
+    
+    # Bytes of transcription worker stderr kept for error reports
+    WORKER_STDERR_TAIL = 4096
+    
     def __init__(self):
         super().__init__()
-        self.core = QuickScribeCore()
+        # Built in on_mount, off the event loop, so the layout paints first
+        self._core: Optional[QuickScribeCore] = None
         self.selected_device: Optional[AudioDevice] = None
-        self.update_timer: Optional[Timer] = None
+        # Device rows in list order, and the same rows by device id
+        self._device_rows: List[DeviceItem] = []
+        self._device_items: Dict[int, DeviceItem] = {}
+        self._recordings: List[Recording] = []
+        self._device_header: Optional[Label] = None
+        # (is_recording, device name) last shown in the header
+        self._last_status_state: Optional[Tuple[bool, str]] = None
+        self._level_meter: Optional[AudioLevelDisplay] = None
+        # Latest level from the recorder's level thread, drained on the UI thread
+        self._pending_level: Optional[float] = None
+        self._level_timer: Optional[Timer] = None
+        self._worker: Optional[asyncio.subprocess.Process] = None
+        self._worker_lock: Optional[asyncio.Lock] = None
+        # Last WORKER_STDERR_TAIL bytes of the worker's stderr, for error reports
+        self._worker_stderr = bytearray()
+        self._worker_stderr_task: Optional[asyncio.Task] = None
+    
+    @property
+    def core(self) -> QuickScribeCore:
+        """The core API, created on first use"""
+        if self._core is None:
+            self._core = QuickScribeCore()
+        return self._core
+    
+    def _init_core(self) -> None:
+        """Create the core and the error log (runs in a worker thread)"""
+        core = self.core
         
         # Set up logging
         logging.basicConfig(
-            filename=f"{self.core.recorder.output_dir}/quickscribe_errors.log",
+            filename=f"{core.recorder.output_dir}/quickscribe_errors.log",
             level=logging.ERROR,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
@@ -239,66 +349,126 @@ class QuickScribeTUI(App):
         
         # Recordings list
         with Container(id="recordings-container"):
-            yield Label("Recent Recordings:")
-            yield ListView(id="recordings-list")
+            yield Label("Recordings:")
+            # OptionList renders only the visible rows, so the full history is cheap
+            yield OptionList(id="recordings-list")
         
         yield Footer()
     
     async def on_mount(self) -> None:
         """Initialize when app starts"""
-        # Load devices
-        await self.refresh_devices()
+        # Serializes jobs to the transcription worker (created on the app's loop)
+        self._worker_lock = asyncio.Lock()
         
-        # Load recordings
-        await self.refresh_recordings()
+        # Device enumeration and the output directory are disk work
+        await asyncio.to_thread(self._init_core)
         
-        # Set up audio level callback
-        self.core.recorder.set_level_callback(self.update_audio_level)
+        # Widgets updated on every state change, looked up once
+        self._device_header = self.query_one("#device-header", Label)
         
-        # Start update timer
-        self.update_timer = self.set_interval(1.0, self.update_status)
+        # Repaint the header whenever recording starts/stops or the device changes
+        self.core.set_state_callback(self.update_status)
+        
+        # Load devices and recordings
+        await self._initial_populate()
+        
+        # Set up audio level callback; levels are applied at most once per
+        # frame, and the flush timer only runs while recording
+        self._level_meter = self.query_one("#level-meter", AudioLevelDisplay)
+        self._level_timer = self.set_interval(1 / 30, self._flush_level, pause=True)
+        self.core.recorder.set_level_callback(self.update_audio_level)
         
         # Set initial focus to device list
         device_list = self.query_one("#device-list", ListView)
         device_list.focus()
     
     def update_audio_level(self, level: float) -> None:
-        """Update audio level display"""
-        try:
-            level_meter = self.query_one("#level-meter", AudioLevelDisplay)
-            level_meter.update_level(level)
-        except Exception:
-            # Ignore if level meter not found
-            pass
-    
-    async def update_status(self) -> None:
-        """Update status display"""
-        device_header = self.query_one("#device-header", Label)
+        """Record the latest audio level (called from the recorder's level thread)"""
+        # A single attribute store; no DOM access off the UI thread
+        self._pending_level = level
+    
+    def _flush_level(self) -> None:
+        """Apply the most recent pending level to the meter"""
+        level = self._pending_level
+        if level is None:
+            return
+        self._pending_level = None
+        self._level_meter.update_level(level)
+    
+    def update_status(self) -> None:
+        """Update status display (the core's state callback)"""
+        is_recording = self.core.is_recording
+        device_name = self.selected_device.name if self.selected_device else "None"
         
-        # Get current status
-        status = "🔴 RECORDING" if self.core.is_recording else "Ready"
+        # Nothing to repaint unless what the header shows has changed
+        state = (is_recording, device_name)
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
         
-        # Get selected device name
-        device_name = self.selected_device.name if self.selected_device else "None"
+        device_header = self._device_header
+        status = "🔴 RECORDING" if is_recording else "Ready"
         
         # Update header
-        device_header.update(f"Audio Devices - Status: {status} - Selected: {device_name}")
+        device_header.update(_DEVICE_HEADER_FMT.format(status=status, device=device_name))
         
         # Apply recording style
-        if self.core.is_recording:
+        if is_recording:
             device_header.add_class("recording")
         else:
             device_header.remove_class("recording")
     
-    async def refresh_devices(self) -> None:
+    async def _initial_populate(self) -> None:
+        """Fill both lists at startup, reading devices and recordings side by side"""
+        # Read everything first, in threads, then touch the DOM
+        devices, recordings = await asyncio.gather(
+            asyncio.to_thread(self.core.get_devices),
+            asyncio.to_thread(self.core.get_recordings),
+        )
+        self._show_recordings(recordings)
+        await self._show_devices(devices)
+    
+    async def refresh_devices(self, force: bool = False) -> None:
         """Refresh device list"""
+        previous = self.selected_device
+        devices = self.core.get_devices(force_refresh=force)
+        
+        # A rescan renumbers devices; the core has already found the selected
+        # one again (or dropped it), so follow it rather than the old id
+        if previous is not None:
+            self.selected_device = self.core.current_device
+            if self.selected_device is None:
+                self.notify(f"{previous.name} is no longer available",
+                            severity="warning")
+            self.update_status()
+        
+        # Falls back to the default input when nothing is selected
+        await self._show_devices(devices)
+    
+    async def _show_devices(self, devices: List[AudioDevice]) -> None:
+        """Update the device rows to show devices"""
         device_list = self.query_one("#device-list", ListView)
-        device_list.clear()
-        
-        devices = self.core.get_devices()
-        for device in devices:
-            is_selected = bool(self.selected_device and device.id == self.selected_device.id)
-            device_list.append(DeviceItem(device, is_selected))
+        selected_id = self.selected_device.id if self.selected_device else None
+        
+        # Rows are recycled by position: existing rows are rebound to the
+        # device now at their index (repainting only if it differs), rows
+        # past the end are removed and only the shortfall is mounted
+        rows = self._device_rows
+        for row, device in zip(rows, devices):
+            row.set_device(device, device.id == selected_id)
+        if len(rows) > len(devices):
+            for row in rows[len(devices):]:
+                await row.remove()
+            del rows[len(devices):]
+        # New rows are mounted in batches of up to MOUNT_BATCH, yielding to
+        # the loop between mounts
+        for start in range(len(rows), len(devices), self.MOUNT_BATCH):
+            batch = [DeviceItem(device, device.id == selected_id)
+                     for device in devices[start:start + self.MOUNT_BATCH]]
+            rows.extend(batch)
+            await device_list.extend(batch)
+            await asyncio.sleep(0)
+        self._device_items = {row.device.id: row for row in rows}
         
         # Select default device if none selected
         if not self.selected_device and devices:
@@ -307,42 +477,54 @@ class QuickScribeTUI(App):
     
     async def refresh_recordings(self) -> None:
         """Refresh recordings list"""
-        recordings_list = self.query_one("#recordings-list", ListView)
-        recordings_list.clear()
-        
-        recordings = self.core.get_recordings()
-        for recording in recordings[:10]:  # Show last 10
-            recordings_list.append(RecordingItem(recording))
+        # Scanning the recordings directory is disk work; keep it off the loop
+        self._show_recordings(await asyncio.to_thread(self.core.get_recordings))
+    
+    def _show_recordings(self, recordings: List[Recording]) -> None:
+        """Replace the recordings list contents in one update"""
+        recordings_list = self.query_one("#recordings-list", OptionList)
+        self._recordings = recordings
+        recordings_list.clear_options()
+        recordings_list.add_options([Option(recording_prompt(recording))
+                                     for recording in self._recordings])
     
     def select_device(self, device: AudioDevice) -> None:
         """Select an audio device"""
+        previous = self.selected_device
         self.selected_device = device
+        # The header is repainted through the core's state callback
         self.core.set_device(device.id)
         
-        # Update header with device info
-        device_header = self.query_one("#device-header", Label)
-        status = "🔴 RECORDING" if self.core.is_recording else "Ready"
-        device_header.update(f"Audio Devices - Status: {status} - Selected: {device.name}")
-        
-        # Refresh device list to update selection indicators
-        asyncio.create_task(self.refresh_devices())
+        # Flip only the two affected selection indicators
+        if previous is not None and previous.id in self._device_items:
+            self._device_items[previous.id].set_selected(False)
+        if device.id in self._device_items:
+            self._device_items[device.id].set_selected(True)
     
     async def on_list_view_selected(self, event: ListView.Selected) -> None:
-        """Handle list selection"""
+        """Handle device list selection"""
         if event.list_view.id == "device-list":
             # Device selected
             item = event.item
             if isinstance(item, DeviceItem):
                 self.select_device(item.device)
-        
-        elif event.list_view.id == "recordings-list":
+    
+    async def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        """Handle recordings list selection"""
+        if event.option_list.id == "recordings-list":
             # Recording selected - view transcript if exists, otherwise transcribe
-            item = event.item
-            if isinstance(item, RecordingItem):
-                if item.recording.has_transcript:
-                    await self.view_transcript_for_recording(item.recording)
+            recording = self._recording_at(event.option_index)
+            if recording:
+                if recording.has_transcript:
+                    await self.view_transcript_for_recording(recording)
                 else:
-                    await self.transcribe_recording(item.recording)
+                    await self.transcribe_recording(recording)
+    
+    def _recording_at(self, index: Optional[int]) -> Optional[Recording]:
+        """Recording shown at a recordings list row, if any"""
+        if index is None or not 0 <= index < len(self._recordings):
+            return None
+        return self._recordings[index]
     
     async def action_toggle_recording(self) -> None:
         """Start or stop recording"""        
@@ -354,12 +536,14 @@ class QuickScribeTUI(App):
             
             success, result = self.core.start_recording()
             if success:
+                self._level_timer.resume()
                 self.notify(f"🔴 Recording to: {result}")
             else:
                 self.notify(f"Failed to start: {result}", severity="error")
         else:
             # Stop recording
             success, filepath = self.core.stop_recording()
+            self._level_timer.pause()
             if success:
                 self.notify("⏹️ Recording saved!")
                 await self.refresh_recordings()
@@ -376,45 +560,85 @@ class QuickScribeTUI(App):
         self.notify(f"Transcribing {recording.filename}...")
         
         try:
-            # Run transcription in separate subprocess to avoid TUI fd conflicts
-            import subprocess
-            import sys
-            
-            # Use the CLI to do transcription in a clean subprocess
-            cmd = [
-                sys.executable, "-m", "quickscribe.interfaces.cli", 
-                "transcribe", recording.filepath
-            ]
-            
-            self.notify("Running transcription in background...")
-            
-            # Run with proper subprocess isolation
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=None,  # Clean environment
-                cwd=None   # Clean working directory
-            )
-            
-            stdout, stderr = await process.communicate()
+            # Run in the long-lived worker process: the model stays loaded
+            # between recordings, and its output never touches the TUI's fds
+            job = json.dumps({"filepath": recording.filepath}).encode("utf-8") + b"\n"
+            async with self._worker_lock:
+                worker = await self._get_transcription_worker()
+                worker.stdin.write(job)
+                await worker.stdin.drain()
+                
+                # One line at a time: progress is shown as it arrives, until
+                # the job's result line
+                while True:
+                    line = await worker.stdout.readline()
+                    if not line:
+                        # Let the drain reach EOF so the tail includes the crash
+                        await self._worker_stderr_task
+                        stderr = self._worker_stderr_text()
+                        logging.error(f"Transcription worker exited\nStderr: {stderr}")
+                        last_line = stderr.splitlines()[-1] if stderr else "no output"
+                        raise RuntimeError(f"transcription worker exited: {last_line}")
+                    reply = json.loads(line)
+                    if "progress" not in reply:
+                        break
+                    self.notify(reply["progress"])
             
-            if process.returncode == 0:
-                self.notify("Transcription complete!", severity="success")
+            if reply.get("ok"):
+                # The worker has already reported completion
                 await self.refresh_recordings()
             else:
-                error_output = stderr.decode('utf-8', errors='replace')
+                error_output = reply.get("error", "unknown error")
                 self.notify(f"Transcription failed: {error_output}", severity="error")
-                logging.error(f"Subprocess transcription failed: {error_output}")
+                logging.error(f"Worker transcription failed: {error_output}\n"
+                              f"Stderr: {self._worker_stderr_text()}")
                 
         except Exception as e:
             error_msg = f"Transcription error: {str(e)} (Type: {type(e).__name__})"
             logging.error(f"{error_msg}\nTraceback: {traceback.format_exc()}")
             self.notify(error_msg, severity="error")
     
+    async def _get_transcription_worker(self) -> asyncio.subprocess.Process:
+        """Start the transcription worker on first use, or again if it died"""
+        if self._worker is None or self._worker.returncode is not None:
+            self._worker = await asyncio.create_subprocess_exec(
+                sys.executable, "-m", "quickscribe.workers.transcriber",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            # Keep reading stderr so the pipe never fills, holding only its tail
+            self._worker_stderr.clear()
+            self._worker_stderr_task = asyncio.create_task(
+                self._drain_worker_stderr(self._worker.stderr))
+        return self._worker
+    
+    async def _drain_worker_stderr(self, stream: asyncio.StreamReader) -> None:
+        """Read the worker's stderr until EOF, keeping the last few KB"""
+        while True:
+            chunk = await stream.read(self.WORKER_STDERR_TAIL)
+            if not chunk:
+                return
+            self._worker_stderr += chunk
+            del self._worker_stderr[:-self.WORKER_STDERR_TAIL]
+    
+    def _worker_stderr_text(self) -> str:
+        """The kept stderr tail, decoded"""
+        return self._worker_stderr.decode("utf-8", errors="replace").strip()
+    
+    async def on_unmount(self) -> None:
+        """Stop the transcription worker"""
+        worker = self._worker
+        if worker is not None and worker.returncode is None:
+            worker.stdin.close()
+            try:
+                await asyncio.wait_for(worker.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                worker.kill()
+    
     async def action_refresh_devices(self) -> None:
         """Refresh device list"""
-        await self.refresh_devices()
+        await self.refresh_devices(force=True)
         self.notify("Devices refreshed")
     
     async def action_select_focused_item(self) -> None:
@@ -431,22 +655,21 @@ class QuickScribeTUI(App):
         
         elif focused and focused.id == "recordings-list":
             # In recordings list - transcribe recording
-            recordings_list = self.query_one("#recordings-list", ListView)
-            if recordings_list.highlighted_child:
-                item = recordings_list.highlighted_child
-                if isinstance(item, RecordingItem):
-                    await self.transcribe_recording(item.recording)
+            recordings_list = self.query_one("#recordings-list", OptionList)
+            recording = self._recording_at(recordings_list.highlighted)
+            if recording:
+                await self.transcribe_recording(recording)
     
     async def action_move_down(self) -> None:
         """Move down in focused list"""
         focused = self.focused
-        if focused and isinstance(focused, ListView):
+        if focused and isinstance(focused, (ListView, OptionList)):
             focused.action_cursor_down()
     
     async def action_move_up(self) -> None:
         """Move up in focused list"""
         focused = self.focused
-        if focused and isinstance(focused, ListView):
+        if focused and isinstance(focused, (ListView, OptionList)):
             focused.action_cursor_up()
     
     
@@ -457,29 +680,39 @@ class QuickScribeTUI(App):
             return
         
         try:
-            # Try UTF-8 first, fallback to other encodings if needed
-            try:
-                with open(recording.transcript_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                # Fallback to latin-1 or errors='replace'
-                with open(recording.transcript_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-            
-            # Skip header if present
-            if "-" * 50 in content:
-                parts = content.split("-" * 50, 2)
-                if len(parts) >= 2:
-                    content = parts[1].strip()
+            # Read in a thread so a long transcript doesn't stall the UI
+            lines = await asyncio.to_thread(self._read_transcript, recording.transcript_path)
             
             # Show transcript in a modal
             modal = TranscriptModal(
                 title=f"Transcript: {recording.filename}",
-                content=content
+                lines=lines
             )
             await self.push_screen(modal)
         except Exception as e:
             self.notify(f"Error reading transcript: {e}", severity="error")
+    
+    @staticmethod
+    def _read_transcript(path: str) -> List[str]:
+        """Read a transcript file as lines, without its header"""
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            head = [line.rstrip('\n') for line in itertools.islice(f, TRANSCRIPT_HEADER_LINES)]
+            lines = f.read().splitlines()
+        
+        # Skip header if present (the lines up to the separator); only the
+        # first few lines are searched
+        if TRANSCRIPT_SEPARATOR in head:
+            head = head[head.index(TRANSCRIPT_SEPARATOR) + 1:]
+        lines[:0] = head
+        
+        # Drop leading blank lines with one slice rather than a pop per line
+        start = next((i for i, line in enumerate(lines) if line.strip()), len(lines))
+        if start:
+            lines = lines[start:]
+        # Whisper starts the text with a space
+        if lines:
+            lines[0] = lines[0].lstrip()
+        return lines
 
 
 
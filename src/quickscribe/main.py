@@ -10,10 +10,18 @@ import os
 
 def main():
     """Main entry point"""
+    # Answer --version before importing any interface
+    if '--version' in sys.argv[1:]:
+        from . import __version__
+        print(f"quickscribe {__version__}")
+        return
+    
     # Check if we're in a terminal that supports TUI
     if sys.stdout.isatty() and os.environ.get('TERM'):
         # Check for --cli flag
         if '--cli' in sys.argv:
+            # Textual is only imported on the TUI path below
+            sys.argv.remove('--cli')
             from .interfaces.cli import main as cli_main
             cli_main()
         else:
@@ -9,20 +9,41 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 class AudioSetupManager:
+    # How long (seconds) subprocess probe results are reused
+    _SP_TTL = 10.0
+    _BREW_TTL = 10.0
+    _OUTPUT_TTL = 2.0
+    
     def __init__(self):
         self.original_output = None
         self.multi_output_device = None
+        self._sp_cache = None
+        self._sp_cache_ts = 0.0
+        self._brew_cache = None
+        self._brew_cache_ts = 0.0
+        self._output_cache = None
+        self._output_cache_ts = 0.0
+        self._caps = None
         
-    def check_blackhole_installed(self):
+    def check_blackhole_installed(self, force=False):
         """Check if BlackHole is installed"""
+        if (not force and self._brew_cache is not None and
+                time.monotonic() - self._brew_cache_ts < self._BREW_TTL):
+            return self._brew_cache
+        
         try:
             result = subprocess.run(['brew', 'list', 'blackhole-2ch'], 
                                   capture_output=True, text=True)
-            return result.returncode == 0
+            installed = result.returncode == 0
         except:
-            return False
+            installed = False
+        
+        self._brew_cache = installed
+        self._brew_cache_ts = time.monotonic()
+        return installed
     
     def install_blackhole(self):
         """Install BlackHole via Homebrew"""
@@ -35,6 +56,8 @@ class AudioSetupManager:
                                   capture_output=True, text=True)
             if result.returncode == 0:
                 print("✅ BlackHole downloaded!")
+                self._brew_cache = True
+                self._brew_cache_ts = time.monotonic()
                 
                 # Find the installer package
                 pkg_path = None
@@ -85,8 +108,38 @@ class AudioSetupManager:
             pass
         return False
     
-    def get_audio_devices(self):
+    def get_audio_devices(self, force=False, slow=False):
+        """Get list of audio devices
+        
+        Uses PortAudio via sounddevice, which answers in milliseconds. Pass
+        slow=True to query system_profiler instead when real CoreAudio UIDs
+        and manufacturer names are needed (takes 1-3 seconds).
+        """
+        if slow:
+            return self._get_audio_devices_profiler(force)
+        
+        try:
+            import sounddevice as sd
+            devices = []
+            for idx, device in enumerate(sd.query_devices()):
+                devices.append({
+                    'name': device.get('name', 'Unknown'),
+                    'manufacturer': 'Unknown',
+                    'input': device.get('max_input_channels', 0),
+                    'output': device.get('max_output_channels', 0),
+                    'uid': f"{device.get('hostapi', 0)}:{idx}"
+                })
+            return devices
+        except Exception as e:
+            print(f"Error getting audio devices: {e}")
+            return []
+    
+    def _get_audio_devices_profiler(self, force=False):
         """Get list of audio devices using system_profiler"""
+        if (not force and self._sp_cache is not None and
+                time.monotonic() - self._sp_cache_ts < self._SP_TTL):
+            return self._sp_cache
+        
         try:
             result = subprocess.run(['system_profiler', 'SPAudioDataType', '-json'],
                                   capture_output=True, text=True)
@@ -106,24 +159,33 @@ class AudioSetupManager:
                         }
                         devices.append(device_info)
             
+            self._sp_cache = devices
+            self._sp_cache_ts = time.monotonic()
             return devices
         except Exception as e:
             print(f"Error getting audio devices: {e}")
             return []
     
-    def get_current_output_device(self):
+    def get_current_output_device(self, force=False):
         """Get current audio output device"""
+        if (not force and self._output_cache is not None and
+                time.monotonic() - self._output_cache_ts < self._OUTPUT_TTL):
+            return self._output_cache
+        
+        # Fallback: check if we can determine from system
+        output = "System Default"
         try:
             # Use SwitchAudioSource if available
             result = subprocess.run(['SwitchAudioSource', '-c'], 
                                   capture_output=True, text=True)
             if result.returncode == 0:
-                return result.stdout.strip()
+                output = result.stdout.strip()
         except:
             pass
         
-        # Fallback: check if we can determine from system
-        return "System Default"
+        self._output_cache = output
+        self._output_cache_ts = time.monotonic()
+        return output
     
     def set_output_device(self, device_name):
         """Set audio output device"""
@@ -131,6 +193,8 @@ class AudioSetupManager:
             # Try using SwitchAudioSource
             result = subprocess.run(['SwitchAudioSource', '-s', device_name], 
                                   capture_output=True, text=True)
+            # Output changed (or may have); drop the cached value
+            self._output_cache = None
             return result.returncode == 0
         except:
             print("⚠️  SwitchAudioSource not found. Install with: brew install switchaudio-osx")
@@ -172,12 +236,34 @@ class AudioSetupManager:
             print(f"❌ Error creating multi-output device: {e}")
             return False
     
+    def check_switchaudio_installed(self):
+        """Check if SwitchAudioSource is available"""
+        try:
+            subprocess.run(['SwitchAudioSource', '-h'], capture_output=True)
+            return True
+        except:
+            return False
+    
+    def _probe_tools(self):
+        """Run all tool/capability probes in parallel and remember the results"""
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            blackhole = pool.submit(self.check_blackhole_installed, True)
+            switchaudio = pool.submit(self.check_switchaudio_installed)
+            current_output = pool.submit(self.get_current_output_device, True)
+            self._caps = {
+                'blackhole': blackhole.result(),
+                'switchaudio': switchaudio.result(),
+                'current_output': current_output.result()
+            }
+        return self._caps
+    
     def setup_system_audio_recording(self):
         """Complete setup for system audio recording"""
         print("\n🎵 Setting up system audio recording...")
+        caps = self._probe_tools()
         
         # Check if BlackHole is installed
-        if not self.check_blackhole_installed():
+        if not caps['blackhole']:
             print("BlackHole is not installed.")
             install = input("Would you like to install it now? (y/n): ").strip().lower()
             if install == 'y':
@@ -190,13 +276,11 @@ class AudioSetupManager:
                 return False
         
         # Store original output device
-        self.original_output = self.get_current_output_device()
+        self.original_output = caps['current_output']
         print(f"📱 Current output device: {self.original_output}")
         
         # Check for SwitchAudioSource
-        try:
-            subprocess.run(['SwitchAudioSource', '-h'], capture_output=True)
-        except:
+        if not caps['switchaudio']:
             print("\n⚠️  SwitchAudioSource not found.")
             print("Install it for automatic audio routing:")
             print("   brew install switchaudio-osx")
@@ -0,0 +1,7 @@
+"""
+Background worker processes for QuickScribe.
+
+Contains long-lived helpers that the interfaces drive over pipes.
+"""
+
+__all__ = []
\ No newline at end of file
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+QuickScribe transcription worker - a long-lived Whisper process
+
+Loads the model once, then reads newline-delimited JSON jobs from stdin:
+
+    {"filepath": "/path/to/recording.wav"}
+
+and answers each on stdout with any number of progress lines followed
+by one result line:
+
+    {"progress": "Transcribing..."}
+    {"ok": true, "txt_path": "/path/to/recording_transcript.txt"}
+    {"ok": false, "error": "..."}
+
+The worker exits when stdin is closed.
+"""
+
+import json
+import os
+import sys
+
+
+def main():
+    """Serve transcription jobs until stdin closes"""
+    # The protocol gets a private copy of fd 1, and fd 1 itself is pointed
+    # at stderr, so native output (CTranslate2/torch logging, tqdm) can't
+    # corrupt it either. Done before importing the ML libraries.
+    sys.stdout.flush()
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    
+    from ..core.transcriber import Transcriber
+    
+    transcriber = Transcriber()
+    try:
+        transcriber.load_model()
+    except Exception as e:
+        # Report it on the first job instead, which retries the load
+        print(f"Model preload failed: {e}", file=sys.stderr)
+    
+    def send(message):
+        replies.write(json.dumps(message) + "\n")
+        replies.flush()
+    
+    def report_progress(text):
+        send({"progress": text})
+    
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            success, result = transcriber.transcribe(job["filepath"], report_progress)
+        except Exception as e:
+            success, result = False, str(e)
+        
+        send({"ok": True, "txt_path": result} if success else {"ok": False, "error": result})
+
+
+if __name__ == "__main__":
+    main()